@@ -72,6 +72,7 @@ from .opencv import get_opencv_version
 from .opencv import mean 
 from .opencv import merge 
 from .opencv import split 
+from .opencv import split_view
 from .opencv import bgr_to_gray
 from .opencv import bgr_to_hsv
 from .opencv import bgr_to_lab
@@ -80,12 +81,18 @@ from .opencv import rgb_to_gray
 from .opencv import rgb_to_hsv
 from .opencv import rgb_to_lab
 from .opencv import rgb_to_bgr
+from .opencv import bgr_to_gray_batch
+from .opencv import rgb_to_gray_batch
+from .opencv import bgr_to_rgb_batch
+from .opencv import rgb_to_bgr_batch
 from .opencv import url_to_image 
+from .opencv import url_to_image_many
 from .opencv import energy_map 
 from .opencv import color_map 
 from .opencv import translate
 from .opencv import rotate 
 from .opencv import edges 
+from .opencv import Edges
 
 # General visualizations
 from .visualizations import hex_to_rgb
@@ -12,9 +12,11 @@
 
 import cv2 as cv
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from urllib.request import urlopen
 
-from .utilities import median, asarray
+from .utilities import median
 from .globals import (
     BGR2GRAY, BGR2RGB, BGR2HSV, BGR2LAB, RGB2BGR, RGB2GRAY, RGB2HSV, RGB2LAB, IMREAD_COLOR
 )
@@ -25,6 +27,7 @@ __all__ = [
     'mean',
     'merge',
     'split',
+    'split_view',
     'bgr_to_gray',
     'bgr_to_hsv',
     'bgr_to_lab',
@@ -33,32 +36,107 @@ __all__ = [
     'rgb_to_hsv',
     'rgb_to_lab',
     'rgb_to_bgr',
+    'bgr_to_gray_batch',
+    'rgb_to_gray_batch',
+    'bgr_to_rgb_batch',
+    'rgb_to_bgr_batch',
     'url_to_image',
+    'url_to_image_many',
     'color_map',
     'energy_map',
     'translate',
     'rotate',
-    'edges'
+    'edges',
+    'Edges'
 ]
 
 
+# OpenCV functions bound once so the wrappers below skip the `cv` attribute lookup on every call
+_cvtColor = cv.cvtColor
+_warpAffine = cv.warpAffine
+_getRotationMatrix2D = cv.getRotationMatrix2D
+_Canny = cv.Canny
+_calcHist = cv.calcHist
+_spatialGradient = cv.spatialGradient
+_convertScaleAbs = cv.convertScaleAbs
+_addWeighted = cv.addWeighted
+_applyColorMap = cv.applyColorMap
+_mean = cv.mean
+_merge = cv.merge
+_split = cv.split
+
+# Identity affine transform; `translate` copies it and fills in the shifts
+_IDENTITY_AFFINE = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype=np.float32)
+
+# Largest number of pixels per cv.calcHist call that keeps its float32 bin counts exact
+_HIST_CHUNK = 1 << 24
+
+# Colormap 11 (cv.COLORMAP_HOT) as a (256, 1, 3) BGR lookup table, built once for `color_map`
+_HOT_COLORMAP_LUT = cv.applyColorMap(np.arange(256, dtype=np.uint8).reshape(256, 1), 11)
+
+# OpenCV major version, resolved once at import
+_CV_MAJOR = cv.__version__.partition('.')[0]
+
+# True only if OpenCV was built with CUDA support and a CUDA-capable GPU is present
+try:
+    _HAS_CUDA = cv.cuda.getCudaEnabledDeviceCount() > 0
+except (AttributeError, cv.error):
+    _HAS_CUDA = False
+
+
 def get_opencv_version():
-    return cv.__version__[0]
+    return _CV_MAJOR
+
+
+def _check_device(device):
+    if device == 'cuda':
+        if not _HAS_CUDA:
+            raise ValueError('device="cuda" requires an OpenCV build with CUDA support and a CUDA-capable GPU')
+    elif device != 'cpu':
+        raise ValueError(f'device must be either "cpu" or "cuda". Got {device}')
+
+
+def _to_gpu(img):
+    gpu_img = cv.cuda_GpuMat()
+    gpu_img.upload(img)
+    return gpu_img
+
+
+def _from_gpu(gpu_img, dst=None):
+    if dst is None:
+        return gpu_img.download()
+    return gpu_img.download(dst)
+
+
+def _cuda_cvt_color(img, code, device, dst=None):
+    _check_device(device)
+    return _from_gpu(cv.cuda.cvtColor(_to_gpu(img), code), dst)
 
 
-def translate(image, x, y):
+def translate(image, x, y, dst=None, device='cpu'):
     """
         Translates a given image across the x-axis and the y-axis
         :param x: shifts the image right (positive) or left (negative)
         :param y: shifts the image down (positive) or up (negative)
+        :param dst: optional preallocated output array (same shape and dtype as `image`)
+        :param device: 'cpu' (default) or 'cuda' to run the warp on the GPU
     """
-    transMat = np.float32([[1, 0, x], [0, 1, y]])
-    return cv.warpAffine(image, transMat, (image.shape[1], image.shape[0]))
+    transMat = _IDENTITY_AFFINE.copy()
+    transMat[0, 2] = x
+    transMat[1, 2] = y
+    dsize = (image.shape[1], image.shape[0])
 
+    if device != 'cpu':
+        _check_device(device)
+        return _from_gpu(cv.cuda.warpAffine(_to_gpu(image), transMat, dsize, flags=cv.INTER_LINEAR), dst)
 
-def rotate(image, angle, rotPoint=None):
+    return _warpAffine(image, transMat, dsize, dst=dst, flags=cv.INTER_LINEAR)
+
+
+def rotate(image, angle, rotPoint=None, device='cpu'):
     """
         Rotates an given image by an angle around a particular rotation point (if provided) or centre otherwise.
+        :param device: 'cpu' (default) or 'cuda' to run the warp on the GPU
     """
     # h, w = image.shape[:2]
     # (cX, cY) = (w/2, h/2)
@@ -82,11 +160,24 @@ def rotate(image, angle, rotPoint=None):
     height, width = image.shape[:2]
 
     # If no rotPoint is specified, we assume the rotation point to be around the centre
-    if rotPoint is None:
-        centre = (width//2, height//2)
+    centre = (width//2, height//2) if rotPoint is None else tuple(rotPoint)
+
+    rotMat = _rotation_matrix(centre, angle)
+
+    if device != 'cpu':
+        _check_device(device)
+        return _from_gpu(cv.cuda.warpAffine(_to_gpu(image), rotMat, (width, height)))
 
-    rotMat = cv.getRotationMatrix2D(centre, angle, scale=1.0)
-    return cv.warpAffine(image, rotMat, (width, height))
+    return _warpAffine(image, rotMat, (width, height))
+
+
+@lru_cache(maxsize=128)
+def _rotation_matrix(centre, angle):
+    """
+        Cached rotation matrix for a (centre, angle) pair.
+        The returned array is shared between calls and must not be modified.
+    """
+    return _getRotationMatrix2D(centre, angle, scale=1.0)
 
 
 # def rotate(img, angle):
@@ -110,40 +201,146 @@ def rotate(image, angle, rotPoint=None):
 #     return cv.warpAffine(img, transMat, (nW, nH))
 
 
-def edges(img, threshold1=None, threshold2=None, use_median=True, sigma=None):
-    if not isinstance(use_median, bool):
-        raise ValueError('use_median must be a boolean')
-
-    if not isinstance(threshold1, int) or not isinstance(threshold2, int):
-        raise ValueError('Threshold values must be integers')
-
+def edges(img, threshold1=None, threshold2=None, use_median=True, sigma=None, device='cpu'):
+    """
+        Computes the Canny edges of an image, using either the median of the image (if `use_median` = True)
+        or 2 threshold values
+        :param device: 'cpu' (default) or 'cuda' to run Canny on the GPU (single-channel uint8 images only)
+    """
     if img is None:
         raise ValueError('Image is of NoneType()')
 
-    if not use_median and (threshold1 is None or threshold2 is None):
-        raise ValueError('Specify valid threshold values')
-    
+    _check_canny_args(threshold1, threshold2, use_median)
+
     if use_median:
-        if sigma is None:
-            sigma = .3
+        sigma = .3 if sigma is None else sigma
+        low, up = _median_thresholds(img, sigma)
+    else:
+        low, up = threshold1, threshold2
 
-        # computes the median of the single channel pixel intensities
-        med = median(img)
+    if device != 'cpu':
+        _check_device(device)
+        return _from_gpu(cv.cuda.createCannyEdgeDetector(low, up).detect(_to_gpu(img)))
 
-        # Canny edge detection using the computed mean
-        low = int(max(0, (1.0-sigma) * med))
-        up = int(min(255, (1.0+sigma) * med))
-        canny_edges = cv.Canny(img, low, up)
-    
+    return _Canny(img, low, up)
+
+
+class Edges:
+    """
+        Canny edge detector for a stream of same-shape images (e.g. video frames)
+        Gradient and output buffers are allocated once and reused by every call
+        :param shape: shape of the images that will be passed in
+        :param sigma: as in edges(); None defaults to 0.3
+        :param update_every: if `use_median` = True, the median thresholds are only recomputed
+            every `update_every` images
+        :param device: 'cpu' (default) or 'cuda' to run Canny on the GPU (single-channel uint8 images only)
+
+        Note: the returned edge map is overwritten by the next call. Copy it if it must be kept.
+        For the same reason an instance must not be shared between threads
+    """
+
+    def __init__(self, shape, threshold1=None, threshold2=None, use_median=True, sigma=None, update_every=1,
+                 device='cpu'):
+        _check_canny_args(threshold1, threshold2, use_median)
+
+        if not isinstance(update_every, int) or update_every < 1:
+            raise ValueError('update_every must be a positive integer')
+
+        _check_device(device)
+
+        self.shape = tuple(shape)
+        self.use_median = use_median
+        self.sigma = .3 if sigma is None else sigma
+        self.update_every = update_every
+        self.device = device
+        self.count = 0
+        self.low, self.up = threshold1, threshold2
+
+        height, width = self.shape[:2]
+        self._out = np.empty((height, width), dtype=np.uint8)
+
+        # Single-channel images go through cv.Canny's gradient overload so the Sobel buffers can be reused
+        if len(self.shape) == 2:
+            self._dx = np.empty((height, width), dtype=np.int16)
+            self._dy = np.empty((height, width), dtype=np.int16)
+        else:
+            self._dx = self._dy = None
+
+        if device == 'cuda':
+            self._gpu_img = cv.cuda_GpuMat()
+            self._detector = cv.cuda.createCannyEdgeDetector(0, 0)
+
+    def __call__(self, img):
+        if img.shape != self.shape:
+            raise ValueError(f'Image of shape {self.shape} expected. Found shape {img.shape}')
+
+        if self.use_median and self.count % self.update_every == 0:
+            self.low, self.up = _median_thresholds(img, self.sigma)
+        self.count += 1
+
+        if self.device == 'cuda':
+            self._gpu_img.upload(img)
+            self._detector.setLowThreshold(self.low)
+            self._detector.setHighThreshold(self.up)
+            return self._detector.detect(self._gpu_img).download(self._out)
+
+        if self._dx is not None and img.dtype == np.uint8:
+            # Same derivatives cv.Canny computes internally (3x3 Sobel, replicated border)
+            _spatialGradient(img, dx=self._dx, dy=self._dy, ksize=3, borderType=cv.BORDER_REPLICATE)
+            return _Canny(self._dx, self._dy, self.low, self.up, edges=self._out)
+
+        return _Canny(img, self.low, self.up, edges=self._out)
+
+
+def _check_canny_args(threshold1, threshold2, use_median):
+    """
+        Validates the threshold arguments shared by edges() and Edges
+    """
+    if use_median is True:
+        return
+
+    if use_median is not False:
+        raise ValueError('use_median must be a boolean')
+
+    # Thresholds are only needed (and validated) when the median is not used
+    if threshold1 is None or threshold2 is None:
+        raise ValueError('Specify valid threshold values')
+
+    if type(threshold1) is not int or type(threshold2) is not int:
+        raise ValueError('Threshold values must be integers')
+
+
+def _median_thresholds(img, sigma):
+    """
+        Canny thresholds of (1 - sigma) * median and (1 + sigma) * median of the pixel intensities
+    """
+    # computes the median of the single channel pixel intensities
+    if img.dtype == np.uint8:
+        # O(N) histogram scan instead of sorting every pixel
+        flat = img.reshape(-1, 1)
+        hist = np.zeros(256, dtype=np.int64)
+        # cv.calcHist counts in float32, which is only exact up to 2**24 per bin
+        for start in range(0, flat.shape[0], _HIST_CHUNK):
+            hist += _calcHist([flat[start:start + _HIST_CHUNK]], [0], None, [256], [0, 256]).ravel().astype(np.int64)
+        cum = np.cumsum(hist)
+
+        # The pixel at sorted index k lies in the first bin whose cumulative count exceeds k
+        n = img.size
+        med = np.searchsorted(cum, n // 2, side='right')
+        if n % 2 == 0:
+            # Even pixel count: average the two middle values, as np.median does
+            med = (np.searchsorted(cum, n // 2 - 1, side='right') + med) / 2
     else:
-        canny_edges = cv.Canny(img, threshold1, threshold2)
+        med = median(img)
 
-    return canny_edges
+    low = int(max(0, (1.0-sigma) * med))
+    up = int(min(255, (1.0+sigma) * med))
+    return low, up
 
 
 def mean(image, mask=None):
     try:
-        return cv.mean(image, mask=mask)
+        return _mean(image, mask=mask)
     except:
         raise ValueError('mean() expects an image')
 
@@ -152,104 +349,237 @@ def merge(img):
     # if not isinstance(img, (list, np.ndarray)):
     #     raise ValueError('img must be a list or numpy.ndarray of (ideally) shape = 3)')
 
-    return cv.merge(img)
+    return _merge(img)
 
 
 def split(img):
     try:
-        return cv.split(img)
+        return _split(img)
     except:
         raise ValueError('mean() expects an image')
 
+
+def split_view(img):
+    """
+        Splits a 3-channel image into its channels without copying any pixels
+        Returns 3 non-contiguous views into `img` (writes to them modify `img`).
+        Use split() if contiguous channels are required
+    """
+    if img.ndim != 3 or img.shape[-1] != 3:
+        raise ValueError(f'Image of shape (H, W, 3) expected. Found shape {img.shape}')
+
+    return img[..., 0], img[..., 1], img[..., 2]
+
     
-def bgr_to_rgb(img):
+def bgr_to_rgb(img, dst=None, device='cpu'):
     """
         Converts a BGR image to its RGB version
+        :param dst: optional preallocated output array
+        :param device: 'cpu' (default) or 'cuda' to run the conversion on the GPU
     """
-    if len(img.shape) != 3:
-        raise ValueError(f'Image of shape 3 expected. Found shape {len(img.shape)}. This method converts a BGR image to its RGB counterpart')
+    if img.ndim != 3:
+        raise ValueError(f'Image of shape 3 expected. Found shape {img.ndim}. This method converts a BGR image to its RGB counterpart')
+
+    if device != 'cpu':
+        return _cuda_cvt_color(img, BGR2RGB, device, dst)
 
-    return cv.cvtColor(img, BGR2RGB)
+    return _cvtColor(img, BGR2RGB, dst=dst)
 
 
-def rgb_to_bgr(img):
+def rgb_to_bgr(img, dst=None, device='cpu'):
     """
         Converts an RGB image to its BGR version
+        :param dst: optional preallocated output array
+        :param device: 'cpu' (default) or 'cuda' to run the conversion on the GPU
     """
-    if len(img.shape) != 3:
-        raise ValueError(f'Image of shape 3 expected. Found shape {len(img.shape)}. This method converts an RGB image to its BGR counterpart')
+    if img.ndim != 3:
+        raise ValueError(f'Image of shape 3 expected. Found shape {img.ndim}. This method converts an RGB image to its BGR counterpart')
+
+    if device != 'cpu':
+        return _cuda_cvt_color(img, RGB2BGR, device, dst)
 
-    return cv.cvtColor(img, RGB2BGR)
+    return _cvtColor(img, RGB2BGR, dst=dst)
 
 
-def bgr_to_gray(img):
+def bgr_to_gray(img, dst=None, device='cpu'):
     """
         Converts a BGR image to its Grayscale version
+        :param dst: optional preallocated output array
+        :param device: 'cpu' (default) or 'cuda' to run the conversion on the GPU
     """
-    if len(img.shape) != 3:
-        raise ValueError(f'Image of shape 3 expected. Found shape {len(img.shape)}. This method converts a BGR image to its Grayscale counterpart')
+    if img.ndim != 3:
+        raise ValueError(f'Image of shape 3 expected. Found shape {img.ndim}. This method converts a BGR image to its Grayscale counterpart')
     
-    return cv.cvtColor(img, BGR2GRAY)
+    if device != 'cpu':
+        return _cuda_cvt_color(img, BGR2GRAY, device, dst)
 
+    return _cvtColor(img, BGR2GRAY, dst=dst)
 
-def rgb_to_gray(img):
+
+def rgb_to_gray(img, dst=None, device='cpu'):
     """
         Converts an RGB image to its Grayscale version
+        :param dst: optional preallocated output array
+        :param device: 'cpu' (default) or 'cuda' to run the conversion on the GPU
     """
-    if len(img.shape) != 3:
-        raise ValueError(f'Image of shape 3 expected. Found shape {len(img.shape)}. This method converts an RGB image to its Grayscale counterpart')
+    if img.ndim != 3:
+        raise ValueError(f'Image of shape 3 expected. Found shape {img.ndim}. This method converts an RGB image to its Grayscale counterpart')
     
-    return cv.cvtColor(img, RGB2GRAY)
+    if device != 'cpu':
+        return _cuda_cvt_color(img, RGB2GRAY, device, dst)
+
+    return _cvtColor(img, RGB2GRAY, dst=dst)
 
 
-def bgr_to_hsv(img):
+def bgr_to_hsv(img, device='cpu'):
     """
         Converts a BGR image to its HSV counterpart
+        :param device: 'cpu' (default) or 'cuda' to run the conversion on the GPU
     """
-    if len(img.shape) != 3:
-        raise ValueError(f'Image of shape 3 expected. Found shape {len(img.shape)}. This method converts a BGR image to its HSV counterpart')
+    if img.ndim != 3:
+        raise ValueError(f'Image of shape 3 expected. Found shape {img.ndim}. This method converts a BGR image to its HSV counterpart')
     
-    return cv.cvtColor(img, BGR2HSV)
+    if device != 'cpu':
+        return _cuda_cvt_color(img, BGR2HSV, device)
 
+    return _cvtColor(img, BGR2HSV)
 
-def rgb_to_hsv(img):
+
+def rgb_to_hsv(img, device='cpu'):
     """
         Converts an RGB image to its HSV counterpart
+        :param device: 'cpu' (default) or 'cuda' to run the conversion on the GPU
     """
-    if len(img.shape) != 3:
-        raise ValueError(f'Image of shape 3 expected. Found shape {len(img.shape)}. This method converts an RGB image to its HSV counterpart')
+    if img.ndim != 3:
+        raise ValueError(f'Image of shape 3 expected. Found shape {img.ndim}. This method converts an RGB image to its HSV counterpart')
     
-    return cv.cvtColor(img, RGB2HSV)
+    if device != 'cpu':
+        return _cuda_cvt_color(img, RGB2HSV, device)
+
+    return _cvtColor(img, RGB2HSV)
 
 
-def bgr_to_lab(img):
+def bgr_to_lab(img, device='cpu'):
     """
         Converts a BGR image to its LAB counterpart
+        :param device: 'cpu' (default) or 'cuda' to run the conversion on the GPU
     """
-    if len(img.shape) != 3:
-        raise ValueError(f'Image of shape 3 expected. Found shape {len(img.shape)}. This method converts a BGR image to its LAB counterpart')
+    if img.ndim != 3:
+        raise ValueError(f'Image of shape 3 expected. Found shape {img.ndim}. This method converts a BGR image to its LAB counterpart')
 
-    return cv.cvtColor(img, BGR2LAB)
+    if device != 'cpu':
+        return _cuda_cvt_color(img, BGR2LAB, device)
 
+    return _cvtColor(img, BGR2LAB)
 
-def rgb_to_lab(img):
+
+def rgb_to_lab(img, device='cpu'):
     """
         Converts an RGB image to its LAB counterpart
+        :param device: 'cpu' (default) or 'cuda' to run the conversion on the GPU
+    """
+    if img.ndim != 3:
+        raise ValueError(f'Image of shape 3 expected. Found shape {img.ndim}. This method converts an RGB image to its LAB counterpart')
+
+    if device != 'cpu':
+        return _cuda_cvt_color(img, RGB2LAB, device)
+
+    return _cvtColor(img, RGB2LAB)
+
+
+def _cvt_batch(imgs, code):
+    """
+        Converts a batch of images of shape (N, H, W, C) with a single cv.cvtColor call
+    """
+    if imgs.size == 0:
+        # cv.cvtColor rejects empty images; convert a single pixel to find the output channels and dtype
+        pixel = _cvtColor(np.zeros((1, 1, imgs.shape[-1]), dtype=imgs.dtype), code)
+        shape = imgs.shape[:-1] if pixel.ndim == 2 else imgs.shape[:-1] + (pixel.shape[-1],)
+        return np.empty(shape, dtype=pixel.dtype)
+
+    # OpenCV treats the N*H stacked rows as one tall image
+    out = _cvtColor(imgs.reshape(-1, imgs.shape[-2], imgs.shape[-1]), code)
+
+    # Grayscale conversions drop the channel axis
+    if out.ndim == 2:
+        return out.reshape(imgs.shape[:-1])
+    return out.reshape(imgs.shape[:-1] + (out.shape[-1],))
+
+
+def bgr_to_rgb_batch(imgs):
+    """
+        Converts a batch of BGR images of shape (N, H, W, 3) to RGB in a single call
+    """
+    if imgs.ndim != 4 or imgs.shape[-1] != 3:
+        raise ValueError(f'Batch of shape (N, H, W, 3) expected. Found shape {imgs.shape}. '
+                         'This method converts a batch of BGR images to their RGB counterparts')
+
+    return _cvt_batch(imgs, BGR2RGB)
+
+
+def rgb_to_bgr_batch(imgs):
+    """
+        Converts a batch of RGB images of shape (N, H, W, 3) to BGR in a single call
     """
-    if len(img.shape) != 3:
-        raise ValueError(f'Image of shape 3 expected. Found shape {len(img.shape)}. This method converts an RGB image to its LAB counterpart')
+    if imgs.ndim != 4 or imgs.shape[-1] != 3:
+        raise ValueError(f'Batch of shape (N, H, W, 3) expected. Found shape {imgs.shape}. '
+                         'This method converts a batch of RGB images to their BGR counterparts')
 
-    return cv.cvtColor(img, RGB2LAB)
+    return _cvt_batch(imgs, RGB2BGR)
 
 
-def energy_map(img):
-    img = bgr_to_gray(img.astype(np.uint8))
+def bgr_to_gray_batch(imgs):
+    """
+        Converts a batch of BGR images of shape (N, H, W, 3) to Grayscale in a single call
+        Returns an array of shape (N, H, W)
+    """
+    if imgs.ndim != 4 or imgs.shape[-1] != 3:
+        raise ValueError(f'Batch of shape (N, H, W, 3) expected. Found shape {imgs.shape}. '
+                         'This method converts a batch of BGR images to their Grayscale counterparts')
+
+    return _cvt_batch(imgs, BGR2GRAY)
+
+
+def rgb_to_gray_batch(imgs):
+    """
+        Converts a batch of RGB images of shape (N, H, W, 3) to Grayscale in a single call
+        Returns an array of shape (N, H, W)
+    """
+    if imgs.ndim != 4 or imgs.shape[-1] != 3:
+        raise ValueError(f'Batch of shape (N, H, W, 3) expected. Found shape {imgs.shape}. '
+                         'This method converts a batch of RGB images to their Grayscale counterparts')
 
-    dx = cv.Sobel(img, cv.CV_16S, 1, 0, ksize=3)
-    abs_x = cv.convertScaleAbs(dx)
-    dy = cv.Sobel(img, cv.CV_16S, 0, 1, ksize=3)
-    abs_y = cv.convertScaleAbs(dy)
-    output = cv.addWeighted(abs_x, 0.5, abs_y, 0.5, 0)
+    return _cvt_batch(imgs, RGB2GRAY)
+
+
+def energy_map(img, out=None):
+    """
+        Computes the gradient energy map of a BGR (or already grayscale) image
+        :param out: optional preallocated (H, W) uint8 output array, e.g. reused across video frames
+    """
+    # No copy when the image is already uint8
+    img = img.astype(np.uint8, copy=False)
+
+    if out is not None and (out.shape != img.shape[:2] or out.dtype != np.uint8 or not out.flags.c_contiguous):
+        raise ValueError(f'out must be a C-contiguous uint8 array of shape {img.shape[:2]}. '
+                         f'Found {out.dtype} array of shape {out.shape}')
+
+    if img.ndim == 2:
+        # Already grayscale; the caller's array must not be overwritten below
+        gray, scratch = img, None
+    else:
+        gray = scratch = bgr_to_gray(img)
+
+    # Both 3x3 Sobel derivatives in a single pass over the grayscale image
+    dx, dy = _spatialGradient(gray, ksize=3)
+
+    # |dx| overwrites our own grayscale buffer (if any); the blend then writes
+    # into `out` (or in place over |dx|), so no further images are allocated
+    abs_x = _convertScaleAbs(dx, dst=scratch)
+    abs_y = _convertScaleAbs(dy)
+    if out is None:
+        out = abs_x
+    output = _addWeighted(abs_x, 0.5, abs_y, 0.5, 0, dst=out)
 
     return output
 
@@ -257,27 +587,42 @@ def energy_map(img):
 def color_map(img):
     gray_img = bgr_to_gray(img) 
 
-    heatmap = cv.applyColorMap(gray_img, 11)
-    superimpose = cv.addWeighted(heatmap, 0.7, img, 0.3, 0)
+    # The user-colormap overload skips rebuilding colormap 11 on every call
+    # (same output as cv.applyColorMap(gray_img, 11))
+    heatmap = _applyColorMap(gray_img, _HOT_COLORMAP_LUT)
+    # The heatmap is our own buffer, so the blend can overwrite it rather than allocate another image
+    superimpose = _addWeighted(heatmap, 0.7, img, 0.3, 0, dst=heatmap)
 
     return superimpose
 
 
 def url_to_image(url, rgb=False):
     # Converts the image to a Numpy array and reads it in OpenCV
-    response = urlopen(url)
-    image = asarray(bytearray(response.read()), dtype='uint8')
-    image = cv.imdecode(image, IMREAD_COLOR)
+    with urlopen(url) as response:
+        buf = response.read()
+
+    # np.frombuffer wraps the downloaded bytes without copying them
+    image = cv.imdecode(np.frombuffer(buf, dtype=np.uint8), IMREAD_COLOR)
     if rgb:
-        image = bgr_to_rgb(image)
+        image = bgr_to_rgb(image, dst=image)
     return image
 
 
+def url_to_image_many(urls, rgb=False, max_workers=None):
+    """
+        Reads in images from multiple URLs concurrently
+        Returns a list of images in the same order as `urls`
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda url: url_to_image(url, rgb=rgb), urls))
+
+
 __all__ = [
     'get_opencv_version',
     'mean',
     'merge',
     'split',
+    'split_view',
     'bgr_to_gray',
     'bgr_to_hsv',
     'bgr_to_lab',
@@ -286,8 +631,14 @@ __all__ = [
     'rgb_to_hsv',
     'rgb_to_lab',
     'rgb_to_bgr',
+    'bgr_to_gray_batch',
+    'rgb_to_gray_batch',
+    'bgr_to_rgb_batch',
+    'rgb_to_bgr_batch',
     'url_to_image',
+    'url_to_image_many',
     'translate',
     'rotate',
-    'edges'
+    'edges',
+    'Edges'
 ]
\ No newline at end of file
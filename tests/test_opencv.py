@@ -0,0 +1,315 @@
+import caer
+import os
+import cv2 as cv
+import numpy as np
+import pytest
+
+from caer.opencv import _median_thresholds
+
+here = os.path.dirname(__file__)
+test_img = os.path.join(here, '..', 'caer', 'data', 'bear.jpg')
+
+
+def test_translate_dst():
+    img = cv.imread(test_img)
+    height, width = img.shape[:2]
+    dst = np.zeros_like(img)
+
+    translated = caer.translate(img, 50, -100, dst=dst)
+    test_against = cv.warpAffine(img, np.float32([[1, 0, 50], [0, 1, -100]]), (width, height))
+
+    assert np.shares_memory(translated, dst)
+    assert np.all(dst == test_against)
+
+
+def test_rotate_around_point():
+    img = cv.imread(test_img)
+    height, width = img.shape[:2]
+
+    rotated = caer.rotate(img, 30, (10, 20))
+    test_against = cv.warpAffine(img, cv.getRotationMatrix2D((10, 20), 30, 1.0), (width, height))
+
+    assert np.all(rotated == test_against)
+
+
+def test_rotate_around_centre():
+    img = cv.imread(test_img)
+    height, width = img.shape[:2]
+
+    rotated = caer.rotate(img, 45)
+    test_against = cv.warpAffine(img, cv.getRotationMatrix2D((width//2, height//2), 45, 1.0), (width, height))
+
+    assert np.all(rotated == test_against)
+
+
+def test_rotate_point_sequences():
+    img = cv.imread(test_img)
+
+    from_tuple = caer.rotate(img, 30, (10, 20))
+
+    assert np.all(caer.rotate(img, 30, [10, 20]) == from_tuple)
+    assert np.all(caer.rotate(img, 30, np.array([10, 20])) == from_tuple)
+
+
+def test_edges_class_matches_edges():
+    img = cv.imread(test_img)
+    gray = cv.cvtColor(img, cv.COLOR_BGR2GRAY)
+
+    assert np.all(caer.Edges(gray.shape)(gray) == caer.edges(gray))
+    assert np.all(caer.Edges(img.shape)(img) == caer.edges(img))
+
+
+def test_edges_class_default_sigma():
+    img = cv.imread(test_img)
+
+    assert np.all(caer.Edges(img.shape, sigma=None)(img) == caer.edges(img, sigma=None))
+    assert np.all(caer.Edges(img.shape, sigma=0.4)(img) == caer.edges(img, sigma=0.4))
+
+
+def test_edges_class_update_every():
+    img = cv.imread(test_img, 0)
+    darker = (img // 2).astype(np.uint8)
+
+    edge_detector = caer.Edges(img.shape, update_every=2)
+    edge_detector(img)
+    low, up = edge_detector.low, edge_detector.up
+
+    # The second image reuses the thresholds computed from the first
+    reused = edge_detector(darker)
+    assert (edge_detector.low, edge_detector.up) == (low, up)
+    assert np.all(reused == cv.Canny(darker, low, up))
+
+    # ... and the third recomputes them
+    edge_detector(darker)
+    assert (edge_detector.low, edge_detector.up) != (low, up)
+
+
+def test_edges_default():
+    img = cv.imread(test_img)
+
+    canny_edges = caer.edges(img)
+
+    assert canny_edges.shape == img.shape[:2]
+    assert canny_edges.dtype == np.uint8
+    assert caer.edges(img, use_median=True, sigma=0.4).shape == img.shape[:2]
+
+
+def test_edges_invalid_arguments():
+    img = cv.imread(test_img)
+
+    with pytest.raises(ValueError, match='Specify valid threshold values'):
+        caer.edges(img, use_median=False)
+
+    with pytest.raises(ValueError, match='Specify valid threshold values'):
+        caer.edges(img, 100, use_median=False)
+
+    with pytest.raises(ValueError, match='Threshold values must be integers'):
+        caer.edges(img, 100.0, 200, use_median=False)
+
+    with pytest.raises(ValueError, match='Threshold values must be integers'):
+        caer.edges(img, True, 200, use_median=False)
+
+    with pytest.raises(ValueError, match='use_median must be a boolean'):
+        caer.edges(img, 100, 200, use_median=1)
+
+
+def _large_gray():
+    # 33,189,601 pixels (odd count, well past float32's exact range of 2**24), split
+    # so that the median of 100 is decided by a single pixel
+    img = np.full(4321 * 7681, 100, dtype=np.uint8)
+    img[:img.size // 2] = 50
+    return img.reshape(4321, 7681)
+
+
+MEDIAN_IMAGES = [
+    ('odd', lambda: np.random.default_rng(0).integers(0, 256, (5, 7), dtype=np.uint8)),
+    ('even', lambda: np.random.default_rng(1).integers(0, 256, (6, 8), dtype=np.uint8)),
+    ('even_split', lambda: np.array([[0, 0, 200, 200]], dtype=np.uint8)),
+    ('odd_3_channel', lambda: np.random.default_rng(2).integers(0, 256, (5, 7, 3), dtype=np.uint8)),
+    ('even_3_channel', lambda: np.random.default_rng(3).integers(0, 256, (6, 8, 3), dtype=np.uint8)),
+    ('bear', lambda: cv.imread(test_img)),
+    ('large', _large_gray),
+]
+
+
+@pytest.mark.parametrize('name, make_img', MEDIAN_IMAGES, ids=[name for name, _ in MEDIAN_IMAGES])
+@pytest.mark.parametrize('sigma', [0, 0.3])
+def test_median_thresholds_match_np_median(name, make_img, sigma):
+    img = make_img()
+    med = np.median(img)
+
+    low, up = _median_thresholds(img, sigma)
+
+    assert (low, up) == (int(max(0, (1.0-sigma) * med)), int(min(255, (1.0+sigma) * med)))
+
+
+def test_edges_uses_np_median_thresholds():
+    img = cv.imread(test_img)
+    med = np.median(img)
+
+    assert np.all(caer.edges(img) == cv.Canny(img, int(max(0, 0.7 * med)), int(min(255, 1.3 * med))))
+
+
+@pytest.mark.parametrize('convert, code, channels', [
+    (caer.bgr_to_gray, cv.COLOR_BGR2GRAY, 1),
+    (caer.rgb_to_gray, cv.COLOR_RGB2GRAY, 1),
+    (caer.bgr_to_rgb, cv.COLOR_BGR2RGB, 3),
+    (caer.rgb_to_bgr, cv.COLOR_RGB2BGR, 3),
+])
+def test_convert_dst(convert, code, channels):
+    img = cv.imread(test_img)
+    shape = img.shape[:2] if channels == 1 else img.shape
+    dst = np.zeros(shape, dtype=np.uint8)
+
+    converted = convert(img, dst=dst)
+
+    assert np.shares_memory(converted, dst)
+    assert np.all(dst == cv.cvtColor(img, code))
+
+
+def test_split_view():
+    img = cv.imread(test_img)
+
+    views = caer.split_view(img)
+
+    for view, channel in zip(views, cv.split(img)):
+        assert np.shares_memory(view, img)
+        assert np.all(view == channel)
+
+
+def test_split_view_requires_3_channels():
+    img = cv.imread(test_img)
+
+    with pytest.raises(ValueError):
+        caer.split_view(cv.cvtColor(img, cv.COLOR_BGR2GRAY))
+
+    with pytest.raises(ValueError):
+        caer.split_view(cv.cvtColor(img, cv.COLOR_BGR2BGRA))
+
+
+DEVICE_CALLS = [
+    pytest.param(lambda img, device: caer.translate(img, 5, 5, device=device), id='translate'),
+    pytest.param(lambda img, device: caer.rotate(img, 30, device=device), id='rotate'),
+    pytest.param(lambda img, device: caer.edges(img, device=device), id='edges'),
+    pytest.param(lambda img, device: caer.bgr_to_gray(img, device=device), id='bgr_to_gray'),
+    pytest.param(lambda img, device: caer.bgr_to_hsv(img, device=device), id='bgr_to_hsv'),
+    pytest.param(lambda img, device: caer.Edges(img.shape, device=device), id='Edges'),
+]
+
+
+@pytest.mark.parametrize('call', DEVICE_CALLS)
+def test_unknown_device(call):
+    img = cv.imread(test_img)
+
+    with pytest.raises(ValueError, match='device must be either'):
+        call(img, 'gpu')
+
+
+@pytest.mark.parametrize('call', DEVICE_CALLS)
+def test_cuda_unavailable(call, monkeypatch):
+    img = cv.imread(test_img)
+    monkeypatch.setattr(caer.opencv, '_HAS_CUDA', False)
+
+    with pytest.raises(ValueError, match='CUDA'):
+        call(img, 'cuda')
+
+
+def _baseline_energy_map(img):
+    gray = cv.cvtColor(img.astype(np.uint8), cv.COLOR_BGR2GRAY)
+    abs_x = cv.convertScaleAbs(cv.Sobel(gray, cv.CV_16S, 1, 0, ksize=3))
+    abs_y = cv.convertScaleAbs(cv.Sobel(gray, cv.CV_16S, 0, 1, ksize=3))
+    return cv.addWeighted(abs_x, 0.5, abs_y, 0.5, 0)
+
+
+def test_energy_map_matches_sobel_pipeline():
+    img = cv.imread(test_img)
+
+    assert np.all(caer.energy_map(img) == _baseline_energy_map(img))
+
+
+def test_energy_map_out():
+    img = cv.imread(test_img)
+    out = np.zeros(img.shape[:2], dtype=np.uint8)
+
+    energy = caer.energy_map(img, out=out)
+
+    assert np.shares_memory(energy, out)
+    assert np.all(out == _baseline_energy_map(img))
+
+
+def test_energy_map_gray_input():
+    img = cv.imread(test_img)
+    gray = cv.cvtColor(img, cv.COLOR_BGR2GRAY)
+    untouched = gray.copy()
+
+    energy = caer.energy_map(gray)
+
+    assert np.all(gray == untouched)
+    assert np.all(energy == _baseline_energy_map(img))
+
+
+def test_energy_map_invalid_out():
+    img = cv.imread(test_img)
+    height, width = img.shape[:2]
+
+    with pytest.raises(ValueError):
+        caer.energy_map(img, out=np.zeros((height, width + 1), dtype=np.uint8))
+
+    with pytest.raises(ValueError):
+        caer.energy_map(img, out=np.zeros((height, width), dtype=np.int16))
+
+    with pytest.raises(ValueError):
+        caer.energy_map(img, out=np.zeros((height, width * 2), dtype=np.uint8)[:, ::2])
+
+
+def test_color_map_matches_apply_color_map():
+    img = cv.imread(test_img)
+
+    test_against = cv.addWeighted(cv.applyColorMap(cv.cvtColor(img, cv.COLOR_BGR2GRAY), 11), 0.7, img, 0.3, 0)
+
+    assert np.all(caer.color_map(img) == test_against)
+
+
+BATCH_CONVERTERS = [
+    (caer.bgr_to_gray_batch, cv.COLOR_BGR2GRAY),
+    (caer.rgb_to_gray_batch, cv.COLOR_RGB2GRAY),
+    (caer.bgr_to_rgb_batch, cv.COLOR_BGR2RGB),
+    (caer.rgb_to_bgr_batch, cv.COLOR_RGB2BGR),
+]
+
+
+@pytest.mark.parametrize('convert, code', BATCH_CONVERTERS)
+def test_batch_matches_cvtcolor(convert, code):
+    img = cv.imread(test_img)
+    imgs = np.stack([img, img[::-1], img[:, ::-1]])
+
+    converted = convert(imgs)
+
+    if code in (cv.COLOR_BGR2GRAY, cv.COLOR_RGB2GRAY):
+        assert converted.shape == imgs.shape[:3]
+    else:
+        assert converted.shape == imgs.shape
+
+    for i in range(len(imgs)):
+        assert np.all(converted[i] == cv.cvtColor(imgs[i], code))
+
+
+@pytest.mark.parametrize('convert, code', BATCH_CONVERTERS)
+def test_batch_empty(convert, code):
+    imgs = np.empty((0, 8, 8, 3), dtype=np.uint8)
+
+    converted = convert(imgs)
+
+    assert converted.dtype == np.uint8
+    assert converted.shape == ((0, 8, 8) if code in (cv.COLOR_BGR2GRAY, cv.COLOR_RGB2GRAY) else (0, 8, 8, 3))
+
+
+@pytest.mark.parametrize('convert, code', BATCH_CONVERTERS)
+def test_batch_requires_4d(convert, code):
+    img = cv.imread(test_img)
+
+    with pytest.raises(ValueError):
+        convert(img)
+
+    with pytest.raises(ValueError):
+        convert(np.zeros((2, 8, 8, 4), dtype=np.uint8))